@@ -5,6 +5,7 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 from booking_system import BookingSystem
@@ -17,6 +18,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Запрос записей за период. Константа на уровне модуля: sqlite3 кэширует
+# скомпилированные выражения по тексту SQL, поэтому один и тот же объект
+# строки переиспользует подготовленный план между вызовами.
+PERIOD_BOOKINGS_SQL = """SELECT b.id, c.name as client_name, c.phone as client_phone,
+          s.name as service_name, m.name as master_name,
+          b.date, b.start_time, s.duration
+   FROM bookings b
+   JOIN clients c ON b.client_id = c.id
+   JOIN services s ON b.service_id = s.id
+   JOIN masters m ON b.master_id = m.id
+   WHERE b.status = 'confirmed' AND b.date BETWEEN ? AND ?
+   ORDER BY b.date, b.start_time"""
+
 class AdminPanel:
     """
     Графический интерфейс администратора салона красоты.
@@ -38,6 +52,13 @@ class AdminPanel:
         """
         try:
             self.booking = BookingSystem()
+            # Кэш справочников услуг и мастеров (имя -> id),
+            # чтобы не перечитывать их из базы при каждом сохранении
+            self._services_by_name: Dict[str, int] = {}
+            self._masters_by_name: Dict[str, int] = {}
+            # Один рабочий поток для запросов к базе, чтобы не блокировать
+            # цикл событий Tk во время загрузки данных
+            self._pool = ThreadPoolExecutor(max_workers=1)
             self.window = tk.Tk()
             self.window.title("Beauty Salon Admin Panel")
             self.window.geometry("1000x600")
@@ -114,11 +135,12 @@ class AdminPanel:
     def _load_data(self) -> None:
         """
         Загрузка и отображение данных в таблице.
-        Обновляет таблицу в соответствии с выбранным периодом.
+        Запрос к базе выполняется в рабочем потоке, чтобы окно
+        оставалось отзывчивым; результат отображается по готовности.
         """
         period = self.period_var.get()
         today = datetime.now().date()
-        
+
         # Определяем период отображения
         if period == "today":
             date_from = today
@@ -129,29 +151,65 @@ class AdminPanel:
         else:  # week
             date_from = today
             date_to = today + timedelta(days=7)
-        
-        # Очищаем таблицу
-        for item in self.bookings_tree.get_children():
-            self.bookings_tree.delete(item)
-        
+
+        future = self._pool.submit(self._get_bookings_for_period, date_from, date_to)
+        self.window.after(50, self._poll_future, future, date_from, date_to)
+
+    def _poll_future(self, future: Future, date_from: datetime.date,
+                     date_to: datetime.date) -> None:
+        """
+        Периодическая проверка готовности фонового запроса.
+        По готовности отображает результат в таблице.
+        """
+        if not future.done():
+            self.window.after(50, self._poll_future, future, date_from, date_to)
+            return
+
         try:
-            # Получаем и отображаем записи
-            bookings = self._get_bookings_for_period(date_from, date_to)
-            for booking in bookings:
-                self.bookings_tree.insert("", tk.END, values=(
-                    booking['id'],
-                    booking['client_name'],
-                    booking['client_phone'],
-                    booking['service_name'],
-                    booking['master_name'],
-                    booking['date'],
-                    booking['start_time'],
-                    f"{booking['duration']} мин"
-                ))
-            logger.info(f"Loaded {len(bookings)} bookings for period {date_from} - {date_to}")
+            bookings = future.result()
         except Exception as e:
             logger.error(f"Error loading bookings: {e}")
             messagebox.showerror("Ошибка", "Не удалось загрузить данные")
+            return
+
+        self._populate_tree(bookings)
+        logger.info(f"Loaded {len(bookings)} bookings for period {date_from} - {date_to}")
+
+    def _populate_tree(self, bookings: List[Dict[str, Any]]) -> None:
+        """
+        Отображение списка записей в таблице.
+
+        Args:
+            bookings: Список записей за выбранный период
+        """
+        # Очищаем таблицу одним вызовом
+        children = self.bookings_tree.get_children()
+        if children:
+            self.bookings_tree.delete(*children)
+
+        # Заранее формируем строки таблицы
+        rows = [
+            (
+                booking['id'],
+                booking['client_name'],
+                booking['client_phone'],
+                booking['service_name'],
+                booking['master_name'],
+                booking['date'],
+                booking['start_time'],
+                f"{booking['duration']} мин"
+            )
+            for booking in bookings
+        ]
+
+        # Отключаем таблицу от окна на время вставки,
+        # чтобы Tk не пересчитывал раскладку на каждую строку
+        self.bookings_tree.pack_forget()
+        try:
+            for row in rows:
+                self.bookings_tree.insert("", tk.END, values=row)
+        finally:
+            self.bookings_tree.pack(fill=tk.BOTH, expand=True)
 
     def _get_bookings_for_period(self, date_from: datetime.date, 
                                date_to: datetime.date) -> List[Dict[str, Any]]:
@@ -165,32 +223,29 @@ class AdminPanel:
         Returns:
             List[Dict]: Список записей с информацией о клиентах, услугах и мастерах
         """
-        all_bookings = []
-        current_date = date_from
-        
-        while current_date <= date_to:
-            date_str = current_date.strftime("%Y-%m-%d")
-            bookings = self.booking.conn.execute(
-                """SELECT b.id, c.name as client_name, c.phone as client_phone,
-                          s.name as service_name, m.name as master_name,
-                          b.date, b.start_time, s.duration
-                   FROM bookings b
-                   JOIN clients c ON b.client_id = c.id
-                   JOIN services s ON b.service_id = s.id
-                   JOIN masters m ON b.master_id = m.id
-                   WHERE b.date = ? AND b.status = 'confirmed'
-                   ORDER BY b.start_time""",
-                (date_str,)
-            ).fetchall()
-            
-            all_bookings.extend([dict(zip(
-                ['id', 'client_name', 'client_phone', 'service_name', 
-                 'master_name', 'date', 'start_time', 'duration'], row)) 
-                for row in bookings])
-            
-            current_date += timedelta(days=1)
-        
-        return all_bookings
+        date_from_str = date_from.strftime("%Y-%m-%d")
+        date_to_str = date_to.strftime("%Y-%m-%d")
+
+        cursor = self.booking.conn.execute(
+            PERIOD_BOOKINGS_SQL, (date_from_str, date_to_str)
+        )
+
+        # row_factory=sqlite3.Row: строки уже отображения имя -> значение
+        return [dict(row) for row in cursor.fetchall()]
+
+    def _load_catalog(self) -> None:
+        """
+        Загрузка справочников услуг и мастеров в кэш.
+        Выполняет по одному запросу к базе; повторные вызовы используют кэш.
+        """
+        if not self._services_by_name:
+            self._services_by_name = {
+                s['name']: s['id'] for s in self.booking.get_all_services()
+            }
+        if not self._masters_by_name:
+            self._masters_by_name = {
+                m['name']: m['id'] for m in self.booking.get_all_masters()
+            }
 
     def _add_booking_dialog(self) -> None:
         """
@@ -211,9 +266,10 @@ class AdminPanel:
         date_var = tk.StringVar(value=datetime.now().strftime("%Y-%m-%d"))
         time_var = tk.StringVar()
         
-        # Заполняем списки услуг и мастеров
-        services = [s['name'] for s in self.booking.get_all_services()]
-        masters = [m['name'] for m in self.booking.get_all_masters()]
+        # Заполняем списки услуг и мастеров из кэша справочников
+        self._load_catalog()
+        services = list(self._services_by_name)
+        masters = list(self._masters_by_name)
         
         # Создаем и размещаем элементы формы
         form_elements = [
@@ -273,11 +329,13 @@ class AdminPanel:
                 messagebox.showerror("Ошибка", "Все поля обязательны для заполнения")
                 return
             
-            # Получаем ID сервиса и мастера
-            service_id = next((s['id'] for s in self.booking.get_all_services() 
-                             if s['name'] == service_name), None)
-            master_id = next((m['id'] for m in self.booking.get_all_masters() 
-                            if m['name'] == master_name), None)
+            # Получаем ID сервиса и мастера из кэша справочников;
+            # при промахе выполняется точечный запрос по имени
+            self._load_catalog()
+            service_id = (self._services_by_name.get(service_name) or
+                          self.booking.get_service_id_by_name(service_name))
+            master_id = (self._masters_by_name.get(master_name) or
+                         self.booking.get_master_id_by_name(master_name))
             
             if not service_id or not master_id:
                 messagebox.showerror("Ошибка", "Услуга или мастер не найдены")
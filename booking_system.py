@@ -1,16 +1,177 @@
 """
 Модуль системы бронирования для салона красоты.
 Обеспечивает управление клиентами, услугами, мастерами и записями.
+
+Доступ к данным идет двумя путями, и это осознанное разделение:
+ORM-сессия (self.db) обслуживает CRUD по сущностям и остается
+переносимой между СУБД, а прямое соединение SQLite (self.conn)
+обслуживает горячие пути — выборку доступности, атомарное создание
+записи и отчеты админ-панели, — где важна цена каждого запроса.
+На не-SQLite базах self.conn равен None и работают ORM-ветки.
 """
 
-from datetime import datetime, time, timedelta
-from typing import List, Dict, Optional, Tuple
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, or_, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
-from db_config import get_db, engine
+from db_config import SQLITE_PRAGMAS, SessionLocal, engine
 from models import Base, Client, Service, Master, Schedule, Booking
 
+def _hm_to_min(value: str) -> int:
+    """Перевод времени "HH:MM" в минуты от полуночи (без strptime)."""
+    return int(value[0:2]) * 60 + int(value[3:5])
+
+
+# Предрассчитанные строки "HH:MM" для каждой минуты суток:
+# форматирование слотов становится индексацией в кортеж
+_HM_STRINGS = tuple(f"{m // 60:02d}:{m % 60:02d}" for m in range(24 * 60))
+
+
+def _min_to_hm(minutes: int) -> str:
+    """Обратный перевод минут от полуночи в строку "HH:MM"."""
+    if 0 <= minutes < 1440:
+        return _HM_STRINGS[minutes]
+    # За пределами суток (например, конец услуги "25:00" в ORM-ветке)
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+try:
+    import numpy as np
+except ImportError:  # numpy не обязателен: вместо массивов используются списки
+    np = None
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:  # numba не обязателен: без него работает чистый Python
+    njit = None
+    _HAS_NUMBA = False
+
+
+def _find_free_slots(work_start_min, work_end_min, duration,
+                     booked_start, booked_end, step=15):
+    """
+    Поиск свободных слотов в рабочем интервале мастера.
+
+    Все времена заданы в минутах от полуночи; занятые интервалы
+    передаются двумя параллельными последовательностями,
+    отсортированными по началу. Возвращает список минут начала
+    свободных слотов с шагом step.
+    """
+    free = []
+    count = len(booked_start)
+    first = 0  # первый интервал, который еще может пересечься со слотом
+    for current in range(work_start_min, work_end_min - duration + 1, step):
+        end = current + duration
+        # Интервалы, закончившиеся до текущего слота, больше не пересекутся
+        # ни с одним из следующих слотов — двигаем нижнюю границу
+        while first < count and booked_end[first] <= current:
+            first += 1
+        available = True
+        for i in range(first, count):
+            if booked_start[i] >= end:
+                break  # дальше интервалы начинаются после конца слота
+            if booked_end[i] > current:
+                available = False
+                break
+        if available:
+            free.append(current)
+    return free
+
+
+# Скомпилированная версия скана; при загруженных днях работает
+# над массивами int32 вместо списков Python
+_find_free_slots_jit = njit(cache=True)(_find_free_slots) if _HAS_NUMBA else None
+
+# Порог числа занятых интервалов, после которого упаковка в массивы
+# и вызов скомпилированного кода окупают свои накладные расходы
+_NUMBA_THRESHOLD = 8
+
+
+def _scan_free_slots(work_start_min, work_end_min, duration, booked):
+    """
+    Выбор реализации скана свободных слотов.
+
+    booked — список пар (начало, конец) в минутах, отсортированный
+    по началу. Малые дни обслуживает чистый Python: для пары занятых
+    интервалов вызов JIT-кода дороже самого скана.
+    """
+    booked_start = [interval[0] for interval in booked]
+    booked_end = [interval[1] for interval in booked]
+    if (_find_free_slots_jit is not None and np is not None
+            and len(booked) > _NUMBA_THRESHOLD):
+        return _find_free_slots_jit(
+            work_start_min, work_end_min, duration,
+            np.asarray(booked_start, dtype=np.int32),
+            np.asarray(booked_end, dtype=np.int32)
+        )
+    return _find_free_slots(work_start_min, work_end_min, duration,
+                            booked_start, booked_end)
+
+# Рабочее время мастера и его занятые интервалы одним запросом:
+# LEFT JOIN дает строку с NULL вместо интервалов, если записей нет
+_AVAILABILITY_SQL = """SELECT s.start_time, s.end_time, b.start_time, b.end_time
+   FROM schedule s
+   LEFT JOIN bookings b ON b.master_id = s.master_id
+        AND b.date = s.date AND b.status = 'confirmed'
+   WHERE s.master_id = ? AND s.date = ?"""
+
+# Атомарное создание записи: время окончания считает SQLite из
+# services.duration, вставка проходит только если услуга существует,
+# интервал лежит в рабочем времени мастера (условие end_t > start
+# отсекает переход через полночь) и не пересекается с подтвержденными
+# записями. Одна инструкция — проверка и вставка не разделимы гонкой;
+# RETURNING сообщает, состоялась ли вставка, без отдельного запроса.
+_CREATE_BOOKING_SQL = """WITH params AS (
+       SELECT substr(time(? || ':00', '+' || duration || ' minutes'), 1, 5) AS end_t
+       FROM services WHERE id = ?
+   )
+   INSERT INTO bookings
+       (client_id, service_id, master_id, date, start_time, end_time, status)
+   SELECT ?, ?, ?, ?, ?, p.end_t, 'confirmed'
+   FROM params p
+   JOIN schedule s ON s.master_id = ? AND s.date = ?
+   WHERE s.start_time <= ? AND s.end_time >= p.end_t AND p.end_t > ?
+     AND NOT EXISTS (
+         SELECT 1 FROM bookings b
+         WHERE b.master_id = ? AND b.date = ? AND b.status = 'confirmed'
+           AND b.start_time < p.end_t AND b.end_time > ?
+     )
+   RETURNING id, end_time"""
+
+# Максимум вставок, объединяемых фоновым писателем в одну транзакцию
+_WRITE_BATCH_SIZE = 32
+
+# Вариант _AVAILABILITY_SQL для нескольких дат сразу; набор
+# плейсхолдеров IN (...) подставляется по количеству дат
+_AVAILABILITY_BULK_SQL = """SELECT s.date, s.start_time, s.end_time,
+          b.start_time, b.end_time
+   FROM schedule s
+   LEFT JOIN bookings b ON b.master_id = s.master_id
+        AND b.date = s.date AND b.status = 'confirmed'
+   WHERE s.master_id = ? AND s.date IN ({placeholders})"""
+
+# Индексы для горячих путей выборок (создаются один раз при старте)
+_INDEX_DDL = [
+    "CREATE INDEX IF NOT EXISTS idx_booking_master_date_status "
+    "ON bookings(master_id, date, status)",
+    "CREATE INDEX IF NOT EXISTS idx_schedule_master_date "
+    "ON schedule(master_id, date)",
+    # Покрывающий индекс для списка записей клиента: строки выходят
+    # уже в порядке (date, start_time) без временного B-дерева
+    "CREATE INDEX IF NOT EXISTS idx_book_client_status_date "
+    "ON bookings(client_id, status, date, start_time)",
+    # Частичный индекс по telegram_id: NULL-значения не занимают место
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_client_tg "
+    "ON clients(telegram_id) WHERE telegram_id IS NOT NULL",
+]
+
 class BookingSystem:
     """
     Система бронирования для салона красоты.
@@ -28,6 +189,54 @@ class BookingSystem:
         Создает таблицы в базе данных и заполняет их начальными данными.
         """
         Base.metadata.create_all(bind=engine)
+        # Прямое соединение SQLite для "сырых" запросов (отчеты админ-панели)
+        self.conn = None
+        if engine.dialect.name == "sqlite":
+            # cached_statements: скомпилированный байткод запросов
+            # переиспользуется между вызовами с одинаковым текстом SQL
+            self.conn = sqlite3.connect(
+                engine.url.database,
+                check_same_thread=False,
+                cached_statements=128
+            )
+            # Строки-отображения вместо кортежей: доступ по имени колонки
+            # без пересборки dict(zip(...)) на каждую строку
+            self.conn.row_factory = sqlite3.Row
+            for pragma in SQLITE_PRAGMAS:
+                self.conn.execute(pragma)
+            # Составной индекс для диапазонных выборок записей: равенство по
+            # статусу первым, затем диапазон дат — вывод идет в порядке
+            # индекса, и сортировка в SQLite не требуется
+            self.conn.execute("DROP INDEX IF EXISTS idx_bookings_date_status")
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_bookings_range "
+                "ON bookings(status, date, start_time)"
+            )
+            # Частичные индексы только по подтвержденным записям: горячие
+            # запросы фильтруют status = 'confirmed' литералом, а отмененные
+            # записи не занимают место в B-дереве
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_book_confirmed "
+                "ON bookings(master_id, date, start_time, end_time) "
+                "WHERE status = 'confirmed'"
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_book_client_confirmed "
+                "ON bookings(client_id, date, start_time) "
+                "WHERE status = 'confirmed'"
+            )
+            self.conn.commit()
+            # Фоновый писатель: объединяет всплески создаваемых записей
+            # в пакеты по одной транзакции (один fsync на пакет)
+            self._write_queue: queue.Queue = queue.Queue()
+            writer = threading.Thread(target=self._write_loop, daemon=True)
+            writer.start()
+        # Одна долгоживущая сессия вместо открытия новой на каждый вызов
+        self.db = SessionLocal()
+        # Кэши справочников: услуги и мастера статичны после заполнения,
+        # перечитывать их из базы на каждый запрос не нужно
+        self._services_cache: Optional[List[Dict]] = None
+        self._masters_cache: Optional[List[Dict]] = None
         self._init_services_and_masters()
         logging.info("Booking system initialized")
 
@@ -40,55 +249,92 @@ class BookingSystem:
         - Список мастеров
         - Расписание работы мастеров на 2 недели вперед
         """
-        db = next(get_db())
+        db = self.db
         try:
-            # Стандартные услуги
-            services = [
-                Service(name="Женская стрижка", duration=60, price=1500),
-                Service(name="Мужская стрижка", duration=30, price=800),
-                Service(name="Окрашивание", duration=120, price=3000),
-                Service(name="Маникюр", duration=90, price=2000),
-                Service(name="Педикюр", duration=90, price=2500)
+            # Индексы для частых фильтров по мастеру/дате/статусу
+            for ddl in _INDEX_DDL:
+                db.execute(text(ddl))
+            db.commit()
+
+            # Стандартные услуги (id заданы явно: services — WITHOUT ROWID)
+            service_rows = [
+                {'id': 1, 'name': "Женская стрижка", 'duration': 60, 'price': 1500},
+                {'id': 2, 'name': "Мужская стрижка", 'duration': 30, 'price': 800},
+                {'id': 3, 'name': "Окрашивание", 'duration': 120, 'price': 3000},
+                {'id': 4, 'name': "Маникюр", 'duration': 90, 'price': 2000},
+                {'id': 5, 'name': "Педикюр", 'duration': 90, 'price': 2500}
             ]
-            
-            for service in services:
-                db.merge(service)
-            
+
             # Мастера
-            masters = [
-                Master(name="Анна", specialization="Парикмахер"),
-                Master(name="Елена", specialization="Колорист"),
-                Master(name="Мария", specialization="Мастер маникюра"),
-                Master(name="Ирина", specialization="Мастер педикюра")
+            master_rows = [
+                {'name': "Анна", 'specialization': "Парикмахер"},
+                {'name': "Елена", 'specialization': "Колорист"},
+                {'name': "Мария", 'specialization': "Мастер маникюра"},
+                {'name': "Ирина", 'specialization': "Мастер педикюра"}
             ]
-            
-            for master in masters:
-                db.merge(master)
-            
+
+            # Одна пакетная вставка на таблицу; существующие имена
+            # пропускаются без предварительных SELECT
+            db.execute(
+                sqlite_insert(Service.__table__)
+                .values(service_rows)
+                .on_conflict_do_nothing(index_elements=['name'])
+            )
+            db.execute(
+                sqlite_insert(Master.__table__)
+                .values(master_rows)
+                .on_conflict_do_nothing(index_elements=['name'])
+            )
+
             db.commit()
             
-            # Стандартное расписание на 2 недели
+            # Убираем дубликаты расписания, накопленные старым merge-циклом,
+            # и гарантируем уникальность пары (master_id, date)
+            db.execute(text(
+                "DELETE FROM schedule WHERE id NOT IN "
+                "(SELECT MIN(id) FROM schedule GROUP BY master_id, date)"
+            ))
+            db.execute(text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS uq_schedule_master_date "
+                "ON schedule(master_id, date)"
+            ))
+
+            # Стандартное расписание на 2 недели одной пакетной вставкой
             masters = db.query(Master).all()
-            for master in masters:
-                for day in range(14):
-                    date = (datetime.now() + timedelta(days=day)).strftime("%Y-%m-%d")
-                    if datetime.strptime(date, "%Y-%m-%d").weekday() < 5:  # Только будни
-                        schedule = Schedule(
-                            master_id=master.id,
-                            date=date,
-                            start_time="10:00",
-                            end_time="19:00"
-                        )
-                        db.merge(schedule)
-            
+            today = datetime.now().date()
+            weekday_dates = [
+                day.isoformat()
+                for day in (today + timedelta(days=offset) for offset in range(14))
+                if day.weekday() < 5  # Только будни
+            ]
+            schedule_rows = [
+                {
+                    'master_id': master.id,
+                    'date': date,
+                    'start_time': "10:00",
+                    'end_time': "19:00"
+                }
+                for master in masters
+                for date in weekday_dates
+            ]
+            # Быстрая проверка: если окно расписания уже заполнено целиком
+            # (обычный случай при перезапуске), вставка не нужна вовсе
+            existing = db.query(Schedule).filter(
+                Schedule.date.between(weekday_dates[0], weekday_dates[-1])
+            ).count() if weekday_dates else 0
+
+            if schedule_rows and existing < len(schedule_rows):
+                db.execute(
+                    insert(Schedule.__table__).prefix_with("OR IGNORE"),
+                    schedule_rows
+                )
+
             db.commit()
             
         except Exception as e:
             db.rollback()
             logging.error(f"Error initializing database: {e}")
             raise
-        finally:
-            db.close()
 
     def add_client(self, name: str, phone: str, telegram_id: Optional[int] = None) -> Optional[int]:
         """
@@ -107,22 +353,22 @@ class BookingSystem:
             Если клиент с таким телефоном или telegram_id уже существует,
             возвращается его ID без создания новой записи.
         """
-        db = next(get_db())
+        db = self.db
         try:
             # Проверяем существование клиента
             existing_client = db.query(Client).filter(
                 (Client.phone == phone) | (Client.telegram_id == telegram_id)
             ).first()
-            
+
             if existing_client:
                 return existing_client.id
-            
+
             # Создаем нового клиента
             client = Client(name=name, phone=phone, telegram_id=telegram_id)
             db.add(client)
             db.commit()
             return client.id
-            
+
         except IntegrityError:
             db.rollback()
             # Если произошла ошибка уникальности, возвращаем существующего клиента
@@ -132,8 +378,6 @@ class BookingSystem:
             db.rollback()
             logging.error(f"Error adding client: {e}")
             return None
-        finally:
-            db.close()
 
     def get_client_id(self, phone: Optional[str] = None, telegram_id: Optional[int] = None) -> Optional[int]:
         """
@@ -150,18 +394,18 @@ class BookingSystem:
         Note:
             Должен быть указан хотя бы один параметр поиска.
         """
-        db = next(get_db())
-        try:
-            query = db.query(Client)
-            if phone:
-                client = query.filter(Client.phone == phone).first()
-            elif telegram_id:
-                client = query.filter(Client.telegram_id == telegram_id).first()
-            else:
-                return None
-            return client.id if client else None
-        finally:
-            db.close()
+        filters = []
+        if phone:
+            filters.append(Client.phone == phone)
+        if telegram_id:
+            filters.append(Client.telegram_id == telegram_id)
+        if not filters:
+            return None
+
+        # Один запрос по обоим параметрам: оба условия закрыты
+        # уникальными индексами по phone и telegram_id
+        row = self.db.query(Client.id).filter(or_(*filters)).first()
+        return row[0] if row else None
 
     def get_all_services(self) -> List[Dict]:
         """
@@ -170,10 +414,9 @@ class BookingSystem:
         Returns:
             List[Dict]: Список услуг с информацией о названии, длительности и цене
         """
-        db = next(get_db())
-        try:
-            services = db.query(Service).all()
-            return [
+        if self._services_cache is None:
+            services = self.db.query(Service).all()
+            self._services_cache = [
                 {
                     'id': s.id,
                     'name': s.name,
@@ -182,8 +425,7 @@ class BookingSystem:
                 }
                 for s in services
             ]
-        finally:
-            db.close()
+        return self._services_cache
 
     def get_service_by_id(self, service_id: int) -> Optional[Dict]:
         """
@@ -195,20 +437,51 @@ class BookingSystem:
         Returns:
             Dict: Информация об услуге
             None: Если услуга не найдена
+
+        Note:
+            Обслуживается из кэша справочника услуг: после первого
+            обращения поиск не ходит в базу до _invalidate_catalog().
+        """
+        for service in self.get_all_services():
+            if service['id'] == service_id:
+                return service
+        return None
+
+    def _invalidate_catalog(self) -> None:
+        """
+        Сброс кэшей справочников.
+        Вызывается после изменения состава услуг или мастеров.
+        """
+        self._services_cache = None
+        self._masters_cache = None
+
+    def get_service_id_by_name(self, name: str) -> Optional[int]:
+        """
+        Поиск ID услуги по точному названию.
+
+        Args:
+            name: Название услуги
+
+        Returns:
+            int: ID услуги
+            None: Если услуга не найдена
         """
-        db = next(get_db())
-        try:
-            service = db.query(Service).filter(Service.id == service_id).first()
-            if service:
-                return {
-                    'id': service.id,
-                    'name': service.name,
-                    'duration': service.duration,
-                    'price': service.price
-                }
-            return None
-        finally:
-            db.close()
+        row = self.db.query(Service.id).filter(Service.name == name).first()
+        return row[0] if row else None
+
+    def get_master_id_by_name(self, name: str) -> Optional[int]:
+        """
+        Поиск ID мастера по имени.
+
+        Args:
+            name: Имя мастера
+
+        Returns:
+            int: ID мастера
+            None: Если мастер не найден
+        """
+        row = self.db.query(Master.id).filter(Master.name == name).first()
+        return row[0] if row else None
 
     def get_all_masters(self) -> List[Dict]:
         """
@@ -217,10 +490,9 @@ class BookingSystem:
         Returns:
             List[Dict]: Список мастеров с информацией о специализации
         """
-        db = next(get_db())
-        try:
-            masters = db.query(Master).all()
-            return [
+        if self._masters_cache is None:
+            masters = self.db.query(Master).all()
+            self._masters_cache = [
                 {
                     'id': m.id,
                     'name': m.name,
@@ -228,8 +500,7 @@ class BookingSystem:
                 }
                 for m in masters
             ]
-        finally:
-            db.close()
+        return self._masters_cache
 
     def get_masters_for_service(self, service_id: int) -> List[Dict]:
         """
@@ -250,84 +521,163 @@ class BookingSystem:
         # Для упрощения возвращаем всех мастеров
         return self.get_all_masters()
 
-    def get_available_slots(self, master_id: int, date: str, service_duration: int) -> List[Dict]:
+    def get_available_slots(self, master_id: int, date: str, service_duration: int) -> List[str]:
         """
         Получение доступных временных слотов для записи.
-        
+
         Args:
             master_id: ID мастера
             date: Дата в формате YYYY-MM-DD
             service_duration: Продолжительность услуги в минутах
-            
+
         Returns:
-            List[Dict]: Список доступных временных слотов
-            
+            List[str]: Времена начала доступных слотов в формате HH:MM
+
         Note:
             Слоты генерируются с шагом 15 минут в рабочее время мастера.
             Учитываются существующие записи и их продолжительность.
+            Время окончания вычисляется при создании записи.
         """
-        db = next(get_db())
-        try:
+        if self.conn is not None:
+            # Рабочее время и занятые интервалы одним запросом к SQLite
+            rows = self.conn.execute(
+                _AVAILABILITY_SQL, (master_id, date)
+            ).fetchall()
+
+            if not rows:
+                return []
+
+            work_start = _hm_to_min(rows[0][0])
+            work_end = _hm_to_min(rows[0][1])
+            booked = sorted(
+                (_hm_to_min(row[2]), _hm_to_min(row[3]))
+                for row in rows if row[2] is not None
+            )
+        else:
+            db = self.db
             # Получаем рабочее время мастера
             schedule = db.query(Schedule).filter(
                 Schedule.master_id == master_id,
                 Schedule.date == date
             ).first()
-            
+
             if not schedule:
                 return []
-            
-            work_start = datetime.strptime(schedule.start_time, "%H:%M").time()
-            work_end = datetime.strptime(schedule.end_time, "%H:%M").time()
-            
+
+            # Переводим времена в минуты от полуночи (формат "HH:MM")
+            work_start = _hm_to_min(schedule.start_time)
+            work_end = _hm_to_min(schedule.end_time)
+
             # Получаем занятые слоты
             booked_slots = db.query(Booking).filter(
                 Booking.master_id == master_id,
                 Booking.date == date,
                 Booking.status == 'confirmed'
             ).all()
-            
-            booked_times = [
-                (
-                    datetime.strptime(b.start_time, "%H:%M").time(),
-                    datetime.strptime(b.end_time, "%H:%M").time()
-                )
+
+            booked = sorted(
+                (_hm_to_min(b.start_time), _hm_to_min(b.end_time))
                 for b in booked_slots
-            ]
-            
-            # Генерируем доступные слоты
-            available_slots = []
-            current_time = work_start
-            
-            while True:
-                end_time = (datetime.combine(datetime.today(), current_time) + 
-                           timedelta(minutes=service_duration)).time()
-                
-                if end_time > work_end:
+            )
+
+        # Генерируем доступные слоты целочисленным сканом
+        free = _scan_free_slots(work_start, work_end, service_duration, booked)
+
+        return [_min_to_hm(m) for m in free]
+
+    def _write_loop(self) -> None:
+        """
+        Цикл фонового писателя записей.
+
+        Снимает из очереди до _WRITE_BATCH_SIZE вставок и выполняет их
+        в одной транзакции; при ошибке пакета повторяет вставки по одной,
+        чтобы сбой одной записи не отменял остальные. Результат каждой
+        вставки передается ожидающему вызову через Future.
+        """
+        while True:
+            batch = [self._write_queue.get()]
+            while len(batch) < _WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
                     break
-                
-                # Проверяем, не пересекается ли слот с существующими записями
-                slot_available = True
-                for booked_start, booked_end in booked_times:
-                    if not (end_time <= booked_start or current_time >= booked_end):
-                        slot_available = False
-                        break
-                
-                if slot_available:
-                    available_slots.append({
-                        'start_time': current_time.strftime("%H:%M"),
-                        'end_time': end_time.strftime("%H:%M")
-                    })
-                
-                # Переходим к следующему слоту с шагом 15 минут
-                current_time = (datetime.combine(datetime.today(), current_time) + 
-                              timedelta(minutes=15)).time()
-            
-            return available_slots
-        finally:
-            db.close()
 
-    def create_booking(self, client_id: int, service_id: int, master_id: int, 
+            try:
+                with self.conn:  # одна транзакция на весь пакет
+                    results = [
+                        self.conn.execute(_CREATE_BOOKING_SQL, params)
+                            .fetchone() is not None
+                        for params, _ in batch
+                    ]
+            except Exception as e:
+                logging.error(f"Error writing booking batch: {e}")
+                results = []
+                for params, _ in batch:
+                    try:
+                        with self.conn:
+                            row = self.conn.execute(
+                                _CREATE_BOOKING_SQL, params
+                            ).fetchone()
+                        results.append(row is not None)
+                    except Exception as item_error:
+                        logging.error(f"Error writing booking: {item_error}")
+                        results.append(False)
+
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+    def get_available_slots_bulk(self, master_id: int, dates: List[str],
+                                 service_duration: int) -> Dict[str, List[str]]:
+        """
+        Получение доступных слотов мастера сразу для нескольких дат.
+
+        Args:
+            master_id: ID мастера
+            dates: Список дат в формате YYYY-MM-DD
+            service_duration: Продолжительность услуги в минутах
+
+        Returns:
+            Dict[str, List[str]]: Времена начала доступных слотов по датам;
+            даты без расписания получают пустой список
+
+        Note:
+            Вместо запроса на каждую дату выполняется один запрос
+            с IN (...) по всем датам; слоты считаются локально.
+        """
+        if not dates:
+            return {}
+
+        if self.conn is None:
+            # Не-SQLite: по запросу на дату через обычный метод
+            return {
+                date: self.get_available_slots(master_id, date, service_duration)
+                for date in dates
+            }
+
+        placeholders = ",".join("?" * len(dates))
+        rows = self.conn.execute(
+            _AVAILABILITY_BULK_SQL.format(placeholders=placeholders),
+            (master_id, *dates)
+        ).fetchall()
+
+        # Раскладываем строки по датам: рабочее окно и занятые интервалы
+        work_hours: Dict[str, tuple] = {}
+        booked_by_date: Dict[str, list] = {}
+        for row in rows:
+            work_hours[row[0]] = (_hm_to_min(row[1]), _hm_to_min(row[2]))
+            if row[3] is not None:
+                booked_by_date.setdefault(row[0], []).append(
+                    (_hm_to_min(row[3]), _hm_to_min(row[4]))
+                )
+
+        result: Dict[str, List[str]] = {date: [] for date in dates}
+        for date, (work_start, work_end) in work_hours.items():
+            booked = sorted(booked_by_date.get(date, []))
+            free = _scan_free_slots(work_start, work_end, service_duration, booked)
+            result[date] = [_min_to_hm(m) for m in free]
+        return result
+
+    def create_booking(self, client_id: int, service_id: int, master_id: int,
                       date: str, start_time: str) -> bool:
         """
         Создание новой записи на услугу.
@@ -346,21 +696,51 @@ class BookingSystem:
             Проверяется доступность выбранного времени и создается запись
             с автоматическим расчетом времени окончания услуги.
         """
-        db = next(get_db())
+        db = self.db
         try:
+            if self.conn is not None:
+                # Атомарная вставка уходит фоновому писателю: при всплеске
+                # запросов несколько записей делят одну транзакцию.
+                # Время окончания считает сам SQL из services.duration
+                params = (
+                    start_time, service_id,
+                    client_id, service_id, master_id, date, start_time,
+                    master_id, date,
+                    start_time, start_time,
+                    master_id, date, start_time
+                )
+                future: Future = Future()
+                self._write_queue.put((params, future))
+                return future.result()
+
             # Получаем продолжительность услуги
             service = db.query(Service).filter(Service.id == service_id).first()
             if not service:
                 return False
-            
-            end_time = (datetime.strptime(start_time, "%H:%M") + 
-                       timedelta(minutes=service.duration)).strftime("%H:%M")
-            
-            # Проверяем доступность времени
-            available_slots = self.get_available_slots(master_id, date, service.duration)
-            if not any(slot['start_time'] == start_time for slot in available_slots):
+
+            end_time = _min_to_hm(_hm_to_min(start_time) + service.duration)
+
+            # Интервал должен попадать в рабочее время мастера
+            # (строки "HH:MM" с ведущими нулями сравниваются как время)
+            schedule = db.query(Schedule).filter(
+                Schedule.master_id == master_id,
+                Schedule.date == date
+            ).first()
+            if (not schedule or start_time < schedule.start_time or
+                    end_time > schedule.end_time):
                 return False
-            
+
+            # Проверяем пересечение с существующими записями
+            conflict = db.query(Booking.id).filter(
+                Booking.master_id == master_id,
+                Booking.date == date,
+                Booking.status == 'confirmed',
+                Booking.start_time < end_time,
+                Booking.end_time > start_time
+            ).first()
+            if conflict:
+                return False
+
             booking = Booking(
                 client_id=client_id,
                 service_id=service_id,
@@ -379,8 +759,6 @@ class BookingSystem:
             db.rollback()
             logging.error(f"Error creating booking: {e}")
             return False
-        finally:
-            db.close()
 
     def get_client_bookings(self, client_id: int) -> List[Dict]:
         """
@@ -392,25 +770,21 @@ class BookingSystem:
         Returns:
             List[Dict]: Список записей с информацией об услуге и мастере
         """
-        db = next(get_db())
-        try:
-            bookings = db.query(Booking).filter(
-                Booking.client_id == client_id,
-                Booking.status == 'confirmed'
-            ).all()
-            
-            return [
-                {
-                    'id': b.id,
-                    'date': b.date,
-                    'start_time': b.start_time,
-                    'service': b.service.name,
-                    'master': b.master.name
-                }
-                for b in bookings
-            ]
-        finally:
-            db.close()
+        bookings = self.db.query(Booking).filter(
+            Booking.client_id == client_id,
+            Booking.status == 'confirmed'
+        ).order_by(Booking.date, Booking.start_time).all()
+
+        return [
+            {
+                'id': b.id,
+                'date': b.date,
+                'start_time': b.start_time,
+                'service': b.service.name,
+                'master': b.master.name
+            }
+            for b in bookings
+        ]
 
     def cancel_booking(self, booking_id: int) -> bool:
         """
@@ -422,19 +796,17 @@ class BookingSystem:
         Returns:
             bool: True если запись отменена успешно, False в случае ошибки
         """
-        db = next(get_db())
+        db = self.db
         try:
             booking = db.query(Booking).filter(Booking.id == booking_id).first()
             if not booking:
                 return False
-            
+
             booking.status = 'cancelled'
             db.commit()
             return True
-            
+
         except Exception as e:
             db.rollback()
             logging.error(f"Error cancelling booking: {e}")
-            return False
-        finally:
-            db.close()
\ No newline at end of file
+            return False
\ No newline at end of file
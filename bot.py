@@ -85,34 +85,49 @@ def create_master_keyboard(masters: List[Dict[str, Any]]) -> ReplyKeyboardMarkup
         resize_keyboard=True
     )
 
-def create_date_keyboard() -> ReplyKeyboardMarkup:
+def upcoming_weekdays(days: int = 14) -> List[str]:
     """
-    Создает клавиатуру для выбора даты (на 14 дней вперед, только рабочие дни).
-    
+    Возвращает список рабочих дат на указанное число дней вперед.
+
+    Args:
+        days: Глубина просмотра в днях
+
     Returns:
-        ReplyKeyboardMarkup: Клавиатура с кнопками дат
+        List[str]: Даты в формате YYYY-MM-DD (только будни)
     """
     today = datetime.now().date()
+    return [
+        (today + timedelta(days=i)).strftime("%Y-%m-%d")
+        for i in range(days) if (today + timedelta(days=i)).weekday() < 5
+    ]
+
+def create_date_keyboard(dates: List[str]) -> ReplyKeyboardMarkup:
+    """
+    Создает клавиатуру для выбора даты.
+
+    Args:
+        dates: Список дат в формате YYYY-MM-DD
+
+    Returns:
+        ReplyKeyboardMarkup: Клавиатура с кнопками дат
+    """
     return ReplyKeyboardMarkup(
-        keyboard=[
-            [KeyboardButton(text=(today + timedelta(days=i)).strftime("%Y-%m-%d"))] 
-            for i in range(14) if (today + timedelta(days=i)).weekday() < 5
-        ],
+        keyboard=[[KeyboardButton(text=d)] for d in dates],
         resize_keyboard=True
     )
 
-def create_time_keyboard(slots: List[Dict[str, Any]]) -> ReplyKeyboardMarkup:
+def create_time_keyboard(slots: List[str]) -> ReplyKeyboardMarkup:
     """
     Создает клавиатуру для выбора времени.
-    
+
     Args:
-        slots: Список доступных временных слотов
-        
+        slots: Список времен начала доступных слотов (HH:MM)
+
     Returns:
         ReplyKeyboardMarkup: Клавиатура с кнопками времени
     """
     return ReplyKeyboardMarkup(
-        keyboard=[[KeyboardButton(text=s['start_time'])] for s in slots],
+        keyboard=[[KeyboardButton(text=s)] for s in slots],
         resize_keyboard=True
     )
 
@@ -208,9 +223,26 @@ async def process_master(message: types.Message, state: FSMContext):
         master_id=selected_master['id'],
         master_name=selected_master['name']
     )
+
+    # Предлагаем только даты, на которые у мастера есть свободные слоты:
+    # доступность по всем дням запрашивается одним пакетным запросом
+    data = await state.get_data()
+    candidate_dates = upcoming_weekdays()
+    slots_by_date = booking.get_available_slots_bulk(
+        selected_master['id'], candidate_dates, data['duration']
+    )
+    dates = [d for d in candidate_dates if slots_by_date.get(d)]
+
+    if not dates:
+        await message.answer(
+            "❌ У этого мастера нет свободных слотов на ближайшие две недели. "
+            "Выберите другого мастера:"
+        )
+        return
+
     await state.set_state(BookingStates.CHOOSE_DATE)
-    
-    keyboard = create_date_keyboard()
+
+    keyboard = create_date_keyboard(dates)
     await message.answer("📅 Выберите дату:", reply_markup=keyboard)
 
 @dp.message(BookingStates.CHOOSE_DATE)
@@ -3,7 +3,7 @@
 Содержит настройки подключения к базе данных и базовые классы SQLAlchemy.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 from dotenv import load_dotenv
 import os
@@ -13,25 +13,61 @@ from sqlalchemy.orm import Session
 # Загружаем переменные окружения из .env файла
 load_dotenv()
 
-# Конфигурация подключения к базе данных
-DB_USER = os.getenv('DB_USER', 'postgres')
-DB_PASSWORD = os.getenv('DB_PASSWORD', 'postgres')
-DB_HOST = os.getenv('DB_HOST', 'localhost')
-DB_PORT = os.getenv('DB_PORT', '5432')
-DB_NAME = os.getenv('DB_NAME', 'beauty_salon')
+# Путь к локальной базе данных SQLite (используется по умолчанию)
+SQLITE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'beauty_salon.db')
 
-# Формируем URL для подключения к базе данных
-DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+# Формируем URL для подключения к базе данных.
+# По умолчанию используется локальный файл SQLite; для PostgreSQL
+# задайте DATABASE_URL или переменные DB_HOST/DB_USER/DB_PASSWORD.
+if os.getenv('DATABASE_URL'):
+    DATABASE_URL = os.environ['DATABASE_URL']
+elif os.getenv('DB_HOST'):
+    DB_USER = os.getenv('DB_USER', 'postgres')
+    DB_PASSWORD = os.getenv('DB_PASSWORD', 'postgres')
+    DB_HOST = os.getenv('DB_HOST', 'localhost')
+    DB_PORT = os.getenv('DB_PORT', '5432')
+    DB_NAME = os.getenv('DB_NAME', 'beauty_salon')
+    DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+else:
+    DATABASE_URL = f"sqlite:///{SQLITE_PATH}"
 
 # Создаем движок SQLAlchemy с настройками пула соединений
-engine = create_engine(
-    DATABASE_URL,
-    pool_size=5,  # Максимальное количество постоянных соединений
-    max_overflow=10,  # Максимальное количество временных соединений
-    pool_timeout=30,  # Таймаут ожидания соединения из пула
-    pool_recycle=1800,  # Переподключение каждые 30 минут
+if DATABASE_URL.startswith('sqlite'):
+    engine = create_engine(
+        DATABASE_URL,
+        connect_args={'check_same_thread': False},  # Доступ из нескольких потоков
+    )
+else:
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=5,  # Максимальное количество постоянных соединений
+        max_overflow=10,  # Максимальное количество временных соединений
+        pool_timeout=30,  # Таймаут ожидания соединения из пула
+        pool_recycle=1800,  # Переподключение каждые 30 минут
+    )
+
+# Настройки SQLite для рабочей нагрузки бота: много мелких чтений,
+# редкие записи. WAL позволяет читать во время записи, synchronous=NORMAL
+# убирает лишние fsync, кэш страниц 64 МБ и mmap сокращают дисковый I/O.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA foreign_keys=ON",
 )
 
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+        """Применяет прагмы к каждому новому соединению SQLite."""
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
 # Создаем фабрику сессий с настройками
 SessionLocal = sessionmaker(
     autocommit=False,  # Отключаем автокоммит
@@ -1,9 +1,17 @@
 """
 Модуль содержит модели данных для системы бронирования салона красоты.
 Использует SQLAlchemy ORM для определения структуры базы данных.
+
+Даты и времена намеренно хранятся текстом: "YYYY-MM-DD" и "HH:MM"
+с ведущими нулями сравниваются лексикографически так же, как
+хронологически, поэтому диапазонные фильтры и составные индексы
+работают по столбцам напрямую, без функций. Горячие пути переводят
+значения в целые минуты на границе (см. _hm_to_min в booking_system),
+так что числовое хранение не дало бы выигрыша, а потребовало бы
+миграции существующих баз.
 """
 
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, UniqueConstraint
 from sqlalchemy.orm import relationship
 from db_config import Base
 
@@ -37,8 +45,16 @@ class Service(Base):
         duration (int): Продолжительность услуги в минутах
         price (int): Стоимость услуги
         bookings (relationship): Связь с бронированиями услуги
+
+    Note:
+        Таблица создается WITHOUT ROWID: небольшой справочник, который
+        читается при каждой записи, хранится прямо в B-дереве первичного
+        ключа без лишнего уровня косвенности. В таких таблицах id не
+        назначается автоматически, поэтому начальные услуги задаются
+        с явными идентификаторами.
     """
     __tablename__ = "services"
+    __table_args__ = {'sqlite_with_rowid': False}
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, nullable=False)
@@ -78,8 +94,15 @@ class Schedule(Base):
         start_time (str): Время начала работы в формате HH:MM
         end_time (str): Время окончания работы в формате HH:MM
         master (relationship): Связь с мастером
+
+    Note:
+        Пара (master_id, date) уникальна: одна строка расписания
+        на мастера в день, повторное заполнение идемпотентно.
     """
     __tablename__ = "schedule"
+    __table_args__ = (
+        UniqueConstraint('master_id', 'date', name='uq_schedule_master_date'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     master_id = Column(Integer, ForeignKey("masters.id", ondelete="CASCADE"), nullable=False)